@@ -1,9 +1,96 @@
 ﻿from __future__ import annotations
 
+import re
+from pathlib import Path
+from typing import Final
+
 import streamlit as st
-from dotenv import load_dotenv
 
-load_dotenv()
+import navigation
+
+# Global stylesheet for every page, injected by _inject_css().
+CSS_PATH: Final[Path] = Path(__file__).parent / "assets" / "studymate.css"
+
+# Static sidebar fragments. The interactive widgets are rendered between
+# them, so each group of HTML goes out in a single markdown call.
+SIDEBAR_HEADER_HTML: Final[str] = """
+    <div style='text-align: left; padding: 1rem 0; border-bottom: 2px solid #334155;'>
+        <h1 style='color: #10b981; font-size: 1.5rem; margin: 0;'>
+            StudyMate AI
+        </h1>
+    </div>
+"""
+
+SIDEBAR_NAV_HTML: Final[str] = """
+    <br>
+
+    <div style='padding: 0 0.5rem;'>
+        <p style='color: #64748b; font-size: 0.75rem; text-transform: uppercase; 
+                  letter-spacing: 1px; margin-bottom: 0.5rem; font-weight: 600;'>
+            Navigation
+        </p>
+    </div>
+"""
+
+SIDEBAR_FOOTER_HTML: Final[str] = """
+    <div class="nav-footer-spacer"></div>
+    <div style='position: fixed; bottom: 0; left: 0; right: 0; padding: 1.5rem; 
+                border-top: 1px solid #334155; 
+                background: linear-gradient(180deg, transparent 0%, #0f1419 100%);
+                width: inherit;'>
+        <p style='color: #64748b; font-size: 0.75rem; text-align: center; margin: 0;'>
+            Made with ❤️ for Education
+        </p>
+        <p style='color: #475569; font-size: 0.7rem; text-align: center; margin-top: 0.25rem;'>
+            Powered by Onyx Team
+        </p>
+    </div>
+"""
+
+
+# Comments are dropped; quoted strings are set aside and restored verbatim,
+# so the whitespace rules below never touch their contents.
+_CSS_COMMENT_OR_STRING_RE = re.compile(
+    r"""/\*.*?\*/|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'""", re.DOTALL
+)
+_CSS_STASH_RE = re.compile(r"\x00(\d+)\x00")
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    strings: list[str] = []
+
+    def _stash(match: re.Match[str]) -> str:
+        token = match.group()
+        if token.startswith("/*"):
+            return ""
+        strings.append(token)
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = _CSS_COMMENT_OR_STRING_RE.sub(_stash, css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = css.replace(": ", ":").replace(";}", "}").strip()
+    return _CSS_STASH_RE.sub(lambda match: strings[int(match.group(1))], css)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """Read and minify the stylesheet once per process."""
+    return _minify_css(CSS_PATH.read_text(encoding="utf-8"))
+
+
+def _inject_css() -> None:
+    """Inject the global stylesheet.
+
+    Streamlit rebuilds the element tree on every rerun, so the <style> element
+    has to be emitted each run; the frontend diffs it against the previous one
+    and skips re-mounting when the content is unchanged.
+    """
+    st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
+
 
 st.set_page_config(
     page_title="StudyMate AI",
@@ -13,173 +100,41 @@ st.set_page_config(
 )
 
 # Enhanced CSS
-st.markdown("""
-    <style>
-        [data-testid="stSidebarNav"] {
-            display: none;
-        }
-        
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #1a1f2e 0%, #0f1419 100%);
-        }
-        
-        .main .block-container {
-            padding-top: 2rem;
-            max-width: 1400px;
-        }
-        
-        .stExpander {
-            background-color: #1e293b;
-            border: 1px solid #334155;
-            border-radius: 8px;
-            margin-bottom: 1rem;
-        }
-        
-        [data-testid="stMetricValue"] {
-            font-size: 2rem;
-            font-weight: 700;
-        }
-        
-        .stButton > button {
-            border-radius: 8px;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-        }
-        
-        [data-testid="stFileUploader"] {
-            border: 2px dashed #4a5568;
-            border-radius: 12px;
-            padding: 2rem;
-            background-color: #1a202c;
-            transition: all 0.3s ease;
-        }
-        
-        [data-testid="stFileUploader"]:hover {
-            border-color: #10b981;
-            background-color: #1e293b;
-        }
-        
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-            background-color: #1e293b;
-            padding: 0.5rem;
-            border-radius: 8px;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            background-color: transparent;
-            border-radius: 6px;
-            padding: 0.5rem 1rem;
-            font-weight: 600;
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background-color: #10b981;
-        }
-        
-        .stProgress > div > div {
-            background-color: #10b981;
-        }
-        
-        .stSelectbox, .stTextInput {
-            margin-bottom: 1rem;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .element-container {
-            animation: fadeIn 0.3s ease;
-        }
-    </style>
-""", unsafe_allow_html=True)
+_inject_css()
+
+# Native multipage routing: pages get their own URL, and the custom sidebar
+# below links to them instead of the built-in navigation menu.
+pages = navigation.build_pages()
+current_page = st.navigation(list(pages.values()), position="hidden")
 
 # Sidebar
 with st.sidebar:
     # Logo with clickable link to home
-    st.markdown("""
-        <div style='text-align: left; padding: 1rem 0; border-bottom: 2px solid #334155;'>
-            <h1 style='color: #10b981; font-size: 1.5rem; margin: 0;'>
-                StudyMate AI
-            </h1>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    # Make logo clickable
-    if st.button("← Home", key="logo_home", use_container_width=True):
-        st.session_state.current_page = "Home"
-        st.rerun()
+    st.markdown(SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
     
-    st.markdown("<br>", unsafe_allow_html=True)
+    # Make logo clickable; disabled on Home so a no-op click cannot rerun
+    home_page = pages[navigation.DEFAULT_PAGE]
+    st.page_link(
+        home_page,
+        label="← Home",
+        use_container_width=True,
+        disabled=current_page is home_page,
+    )
     
     # Navigation section
-    st.markdown("""
-        <div style='padding: 0 0.5rem;'>
-            <p style='color: #64748b; font-size: 0.75rem; text-transform: uppercase; 
-                      letter-spacing: 1px; margin-bottom: 0.5rem; font-weight: 600;'>
-                Navigation
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_NAV_HTML, unsafe_allow_html=True)
     
-    if "current_page" not in st.session_state:
-        st.session_state.current_page = "Home"
-    
-    pages = {
-        "Home": "",
-        "Study": "",
-        "Community": "",
-        "History": ""
-    }
-    
-    for page_name, icon in pages.items():
-        is_selected = st.session_state.current_page == page_name
-        
-        if st.button(
-            f"{icon} {page_name}", 
-            key=f"nav_{page_name}",
-            use_container_width=True,
-            type="primary" if is_selected else "secondary"
-        ):
-            st.session_state.current_page = page_name
-            st.rerun()
+    # The open page's entry is disabled too, so re-clicking it is a no-op
+    for page in pages.values():
+        st.page_link(page, use_container_width=True, disabled=page is current_page)
     
     # Footer
-    st.markdown("<br><br><br>", unsafe_allow_html=True)
-    st.markdown("""
-        <div style='position: fixed; bottom: 0; left: 0; right: 0; padding: 1.5rem; 
-                    border-top: 1px solid #334155; 
-                    background: linear-gradient(180deg, transparent 0%, #0f1419 100%);
-                    width: inherit;'>
-            <p style='color: #64748b; font-size: 0.75rem; text-align: center; margin: 0;'>
-                Made with ❤️ for Education
-            </p>
-            <p style='color: #475569; font-size: 0.7rem; text-align: center; margin-top: 0.25rem;'>
-                Powered by Onyx Team
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_FOOTER_HTML, unsafe_allow_html=True)
 
 # Main content
-page = st.session_state.current_page
-
-if page == "Home":
-    from pages import home
-    home.show()
-elif page == "Study":
-    from pages import study
-    study.show()
-elif page == "Community":
-    from pages import community
-    community.show()
-elif page == "History":
-    from pages import history
-    history.show()
+current_page.run()
+
+if not st.session_state.get("_preloaded"):
+    st.session_state["_preloaded"] = True
+    navigation.preload_pages()
 
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from functools import lru_cache
+from types import ModuleType
+from typing import Callable, Dict, Final
+
+import streamlit as st
+from streamlit.navigation.page import StreamlitPage
+
+# Page name -> icon. Each entry is backed by views/<name lower>.py and its show().
+PAGES: Final[Dict[str, str]] = {
+    "Home": "",
+    "Study": "",
+    "Community": "",
+    "History": "",
+}
+DEFAULT_PAGE: Final[str] = "Home"
+
+
+@lru_cache(maxsize=None)
+def get_page_module(name: str) -> ModuleType:
+    """
+    Import the module behind a PAGES entry, once per process.
+    """
+    return importlib.import_module(f"views.{name.lower()}")
+
+
+def _page_runner(name: str) -> Callable[[], None]:
+    def run() -> None:
+        get_page_module(name).show()
+
+    run.__name__ = name.lower()
+    return run
+
+
+def build_pages() -> Dict[str, StreamlitPage]:
+    """
+    Build the st.Page objects for st.navigation, keyed by page name.
+
+    Must be called during a script run. Pages are matched by url_path, so
+    the objects built by separate calls point to the same page.
+    """
+    return {
+        name: st.Page(
+            _page_runner(name),
+            title=name,
+            icon=icon or None,
+            url_path=name.lower(),
+            default=name == DEFAULT_PAGE,
+        )
+        for name, icon in PAGES.items()
+    }
+
+
+def switch_to(name: str) -> None:
+    """
+    Navigate to a PAGES entry, e.g. from a button on another page.
+    """
+    st.switch_page(build_pages()[name])
+
+
+def preload_pages() -> None:
+    """
+    Import every page module in a daemon thread.
+
+    Only the visited page is imported on the render path; the others are
+    warmed up in the background so the first visit does not block on imports.
+    """
+    def _load_all() -> None:
+        for name in PAGES:
+            get_page_module(name)
+
+    threading.Thread(target=_load_all, daemon=True).start()
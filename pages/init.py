@@ -1 +0,0 @@
-# This file makes the pages directory a Python package
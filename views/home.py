@@ -2,6 +2,8 @@
 
 import streamlit as st
 
+import navigation
+
 
 def show():
     """Display the enhanced home/landing page with improved visuals and spacing."""
@@ -168,7 +170,6 @@ def show():
         st.markdown("<div style='margin-top: 2rem;'></div>", unsafe_allow_html=True)
         
         if st.button("🚀 Get Started Now", type="primary", use_container_width=True):
-            st.session_state.current_page = "Study"
-            st.rerun()
+            navigation.switch_to("Study")
     
     st.markdown("<div style='margin: 3rem 0;'></div>", unsafe_allow_html=True)
@@ -0,0 +1 @@
+# This file makes the views directory a Python package
@@ -0,0 +1,950 @@
+﻿from __future__ import annotations
+
+import html
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Tuple
+import streamlit as st
+from dotenv import load_dotenv
+
+# agents (and the LangChain clients behind it) is imported only when a
+# pipeline or roadmap actually runs; load .env here so key checks see it.
+load_dotenv()
+
+ENGINE_OPTIONS: Mapping[str, Dict[str, str]] = MappingProxyType({
+    "Chat GPT 5.1 (OpenAI)": {"code": "openai", "env_var": "OPENAI_API_KEY"},
+    "Deepseek 3.1": {"code": "deepseek", "env_var": "DEEPSEEK_API_KEY"},
+    "Gemini 3.1": {"code": "gemini", "env_var": "GOOGLE_API_KEY"},
+    "Grok 4.1": {"code": "grok", "env_var": "XAI_API_KEY"},
+})
+DEFAULT_ENGINE = "deepseek"
+QUIZ_CHOICE_PREFIX = "quiz_choice_q_"
+QUIZ_OPTION_KEYS = ("A", "B", "C", "D")
+QUIZ_MAX_SCORE = 20
+
+SUBJECTS_DB: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "Mathematics": ("Derivatives and Limits", "Integrals", "Linear Algebra", "Statistics", "Probability"),
+    "Physics": ("Mechanics", "Thermodynamics", "Electromagnetism", "Quantum Physics", "Optics"),
+    "Chemistry": ("Organic Chemistry", "Inorganic Chemistry", "Physical Chemistry", "Biochemistry"),
+    "Computer Science": ("Data Structures", "Algorithms", "Operating Systems", "Networks", "Databases"),
+    "Biology": ("Cell Biology", "Genetics", "Evolution", "Ecology", "Human Anatomy"),
+    "History": ("World War 2", "Ancient Civilizations", "Industrial Revolution", "Cold War"),
+    "Literature": ("Shakespeare", "Poetry Analysis", "Modern Literature", "Literary Criticism"),
+    "Economics": ("Microeconomics", "Macroeconomics", "International Trade", "Game Theory"),
+})
+
+# Selectbox options and label -> position lookups, built once at import.
+_ENGINE_LABELS = tuple(ENGINE_OPTIONS)
+_ENGINE_INDEX = {label: i for i, label in enumerate(_ENGINE_LABELS)}
+_SUBJECT_KEYS = tuple(SUBJECTS_DB)
+_SUBJECT_INDEX = {subject: i for i, subject in enumerate(_SUBJECT_KEYS)}
+
+_HERO_HTML = """
+    <div style='background: linear-gradient(90deg, #10b981 0%, #059669 100%);
+                padding: 2rem; border-radius: 12px; margin-bottom: 2rem;'>
+        <h1 style='color: white; margin: 0; font-size: 2.5rem;'>Your Studies Companion</h1>
+        <p style='color: #f0f0f0; margin-top: 0.5rem; font-size: 1rem;'>
+            Multi-Agent Study Assistant: Generate comprehensive study materials powered by AI
+        </p>
+    </div>
+"""
+
+# Numbered section box; format with n= and title=.
+_SECTION_TMPL = """
+    <div style='background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
+                padding: 1.5rem; border-radius: 12px; border: 1px solid #334155; margin-bottom: 2rem;'>
+        <h2 style='color: #10b981; margin-bottom: 1rem; display: flex; align-items: center;'>
+            <span style='background: #10b981; color: white; width: 32px; height: 32px; 
+                         border-radius: 50%; display: inline-flex; align-items: center; 
+                         justify-content: center; margin-right: 0.75rem; font-size: 1.2rem;'>{n}</span>
+            {title}
+        </h2>
+    </div>
+"""
+
+_PIPELINE_SUMMARY_HTML = """
+    <div style='background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
+                padding: 1.5rem; border-radius: 12px; border: 1px solid #334155; margin-bottom: 1rem;'>
+        <h3 style='color: #10b981;'>Pipeline Execution Summary</h3>
+        <p style='color: #94a3b8;'>Below is the detailed workflow of each AI agent in the pipeline.</p>
+    </div>
+"""
+
+_PIPELINE_FLOW_HTML = """
+    <div style='background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
+                padding: 1.5rem; border-radius: 12px; border: 1px solid #10b981; margin-top: 1rem;'>
+        <h4 style='color: #10b981;'>Pipeline Flow</h4>
+        <p style='color: #94a3b8;'>A1 → A2 → A4 → {A5, A6, A7, A8} → A9</p>
+        <p style='color: #94a3b8; font-size: 0.9rem;'>Or: A3 → A4 → {A5, A6, A7, A8} → A9 (when file is uploaded)</p>
+    </div>
+"""
+
+# Quiz question header; format with q_num= and text=.
+_QUIZ_QUESTION_TMPL = """
+    <div style='background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
+                padding: 1.5rem; border-radius: 12px; border: 1px solid #334155;
+                margin-bottom: 1.5rem;'>
+        <h4 style='color: #10b981;'>Q{q_num}: {text}</h4>
+    </div>
+"""
+
+# Answer box shown after the quiz is submitted; format with bg_color=, border_color=, option_text=.
+_QUIZ_OPTION_TMPL = """
+    <div style='background: {bg_color}; color: white; padding: 0.75rem 1rem;
+                border: 2px solid {border_color}; border-radius: 8px;
+                margin-bottom: 0.5rem;'>
+        {option_text}
+    </div>
+"""
+
+# Open exercise box; format with number= and text=.
+_EXERCISE_TMPL = """
+    <div style='background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
+                padding: 1.5rem; border-radius: 12px; border: 1px solid #334155;
+                margin-bottom: 1rem;'>
+        <strong>E{number}:</strong> {text}
+    </div>
+"""
+
+# (is_selected, is_correct) -> (background, border) for a submitted answer box.
+_QUIZ_COLORS: Dict[Tuple[bool, bool], Tuple[str, str]] = {
+    (True, True): ("#10b981", "#059669"),
+    (True, False): ("#ef4444", "#dc2626"),
+    (False, True): ("#1e293b", "#334155"),
+    (False, False): ("#1e293b", "#334155"),
+}
+
+_EXECUTED_LABEL = "✅ Executed"
+_FAILED_LABEL = "❌ Failed"
+
+
+@dataclass(frozen=True, slots=True)
+class AgentCard:
+    """One debug tab card: what the agent does and how to report its output."""
+    title: str
+    function: str
+    input: str
+    output: str
+    key: str
+    skipped: str
+    fallback: str
+    # Output containing "ERROR" anywhere means the agent did not really run.
+    error_means_skipped: bool = False
+    # The agent always runs, so an empty output still reports as executed.
+    always_executed: bool = False
+    # Read key from session state instead of the pipeline output.
+    in_session_state: bool = False
+
+
+# Debug tab agent cards, in pipeline order.
+AGENT_CARDS: Tuple[AgentCard, ...] = (
+    AgentCard("🔍 A1_Everything - Web Search Agent", "Global web search for study materials",
+              "Subject and Chapter", "Raw web search results with URLs and snippets",
+              "a1_output", "⏭️ Skipped (file uploaded)", "Skipped - File was uploaded"),
+    AgentCard("🧹 A2_Cleaner - Content Filter Agent", "Filters and cleans raw search results",
+              "Raw web search output from A1", "Cleaned, relevant content grouped by topic",
+              "a2_output", "⏭️ Skipped (file uploaded)", "Skipped - File was uploaded"),
+    AgentCard("📄 A3_Adapter - File Ingestion Agent", "Extracts text from uploaded files",
+              "PDF, DOCX, or TXT file", "Plain text content from the file",
+              "a3_output", "⏭️ No file uploaded", "No file uploaded",
+              error_means_skipped=True),
+    AgentCard("📝 A4_Summarizer - Study Notes Generator", "Creates study notes from cleaned content",
+              "Cleaned context from A2 or A3", "Structured study notes with key concepts",
+              "summary", "", "",
+              always_executed=True),
+    AgentCard("🎥 A5_Collector - Video Search Agent", "Finds relevant YouTube tutorial videos",
+              "Subject and Chapter", "List of video titles and URLs",
+              "videos", "⏭️ Not requested", "Not requested"),
+    AgentCard("💻 A6_Relations - Projects Finder Agent", "Searches GitHub and DockerHub for related projects",
+              "Subject and Chapter", "Project listings with descriptions and URLs",
+              "projects", "⏭️ Not requested", "Not requested"),
+    AgentCard("✅ A7_AI_Companion - Quiz Generator Agent", "Generates practice questions and exercises",
+              "Summary from A4", "MCQ questions and open exercises",
+              "quizzes", "⏭️ Not requested", "Not requested"),
+    AgentCard("📄 A8_Examiner - Exam Finder Agent", "Searches for past exam papers",
+              "Subject and Chapter", "List of exam PDF links",
+              "exams", "⏭️ Not requested", "Not requested"),
+    AgentCard("🗺️ A9_Guide - Roadmap Generator Agent", "Creates personalized study roadmap",
+              "Summary and quiz performance", "Step-by-step learning plan",
+              "roadmap", "⏭️ Not generated yet", "Not generated yet",
+              in_session_state=True),
+)
+
+# One markdown block per agent card; trailing double spaces are line breaks.
+_AGENT_CARD_MD = "**Function:** {fn}  \n**Input:** {inp}  \n**Output:** {outp}  \n**Status:** {status}"
+
+# Output run_pipeline records for an agent that raised; format with key=, exc=.
+# agents.py reports its own handled errors the same way ("[A2_Cleaner ERROR] ..."),
+# so _AGENT_ERROR_RE matches both.
+_AGENT_ERROR_TMPL = "[{key} ERROR] {exc}"
+_AGENT_ERROR_RE = re.compile(r'^\[\w+ ERROR\] ')
+
+_URL_RE = re.compile(r'(https?://[^\s\)]+)')
+_ENTRY_RE = re.compile(r'\[\d+\]')
+_YT_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/)([A-Za-z0-9_-]+)')
+_PROJECT_MARK_RE = re.compile(r'\[\d+\]|^-{5,}$', re.MULTILINE)
+_URL_LINE_RE = re.compile(r'^URL:(.*)$', re.MULTILINE)
+_NOTE_LINE_RE = re.compile(r'^Note:(.*)$', re.MULTILINE)
+_GITHUB_REPO_RE = re.compile(r'github\.com/([^/\s]+)/([^/\s]+)')
+_QUESTION_RE = re.compile(
+    r'Q(\d+):\s*(.*?)\nA\)(.*?)\nB\)(.*?)\nC\)(.*?)\nD\)(.*?)\nCorrect answer:\s*([A-D])',
+    re.DOTALL,
+)
+_EXERCISE_RE = re.compile(r'E(\d+):\s*(.*?)(?=E\d+:|$)', re.DOTALL)
+
+
+@lru_cache(maxsize=16)
+def check_api_key(env_var: str) -> bool:
+    # The environment is fixed once load_dotenv() has run at import.
+    return bool(os.environ.get(env_var))
+
+
+def init_session_state():
+    defaults = {
+        "mas_output": None,
+        "summary": "",
+        "videos": "",
+        "projects": "",
+        "quizzes": "",
+        "exams": "",
+        "roadmap": "",
+        "engine_code": DEFAULT_ENGINE,
+        "help_types": ["Summarize (Default)", "Quizzes/Exercises"],
+        "study_history": [],
+        "quiz_score": 0,
+        "quiz_answers": {},
+        "quiz_submitted": False,
+        "selected_subject": "Mathematics",
+        "selected_chapter": "",
+        "_parsed_cache": {},
+    }
+    for key, value in defaults.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+
+
+def reset_quiz_state():
+    """Clear the score, recorded answers and the quiz form's radio selections."""
+    st.session_state.quiz_score = 0
+    st.session_state.quiz_answers = {}
+    st.session_state.quiz_submitted = False
+    for key in [k for k in st.session_state.keys() if k.startswith(QUIZ_CHOICE_PREFIX)]:
+        del st.session_state[key]
+
+
+def submit_quiz(questions: List[QuizQuestion], points_per_question: float):
+    """Grade the quiz form's radio selections and record the result."""
+    score = 0
+    answers = {}
+    for question in questions:
+        q_num = question.number
+        answer = st.session_state.get(f"{QUIZ_CHOICE_PREFIX}{q_num}")
+        answers[f"q_{q_num}"] = answer
+        if answer == question.correct:
+            score += points_per_question
+    
+    st.session_state.quiz_answers = answers
+    st.session_state.quiz_score = round(score, 1)
+    st.session_state.quiz_submitted = True
+
+
+def sanitize_text(value: Any) -> str:
+    return "" if value is None else value if isinstance(value, str) else str(value)
+
+
+def _clip(text: str | None, limit: int = 8000) -> str | None:
+    """Cap raw agent output shown in the debug tab, noting how much was cut."""
+    if text is None or len(text) <= limit:
+        return text
+    return text[:limit] + f"\n… ({len(text) - limit} chars truncated)"
+
+
+def _display(value: Any, fallback: str = "Not requested") -> str:
+    """Debug card text: clipped agent output, or the card's literal fallback as-is."""
+    return sanitize_text(_clip(value)) if value else fallback
+
+
+def is_agent_error(value: Any) -> bool:
+    """True if value is an agent error string.
+
+    Covers both the placeholder run_pipeline stores for an agent that raised
+    and the "[<Agent> ERROR] ..." strings agents.py returns for errors it
+    handles itself.
+    """
+    return isinstance(value, str) and _AGENT_ERROR_RE.match(value) is not None
+
+
+def failed_agents(output: Dict[str, Any]) -> List[str]:
+    """Card titles of the agents whose output is an error, in pipeline order."""
+    return [card.title for card in AGENT_CARDS if is_agent_error(output.get(card.key))]
+
+
+def agent_status(card: AgentCard, value: Any) -> str:
+    """Status line for a debug agent card, following the card's rules."""
+    if is_agent_error(value):
+        return _FAILED_LABEL
+    if card.always_executed:
+        return _EXECUTED_LABEL
+    executed = bool(value) and not (card.error_means_skipped and "ERROR" in value)
+    return (card.skipped, _EXECUTED_LABEL)[executed]
+
+
+def render_text(value: Any) -> str:
+    """Prepare agent output for st.markdown in one pass: coerce to str, link URLs."""
+    if value is None:
+        return ""
+    if isinstance(value, (bytes, bytearray)):
+        text = bytes(value).decode("utf-8", errors="replace")
+    else:
+        text = value if isinstance(value, str) else str(value)
+    if "http" not in text:
+        return text
+    return _URL_RE.sub(r"[Click Here](\1)", text)
+
+
+def cached_parse(parser: Callable[[str], Any], raw_text: str) -> Any:
+    """Memoize a parser on its raw input for the session, so reruns skip re-parsing."""
+    cache = st.session_state._parsed_cache
+    key = (parser.__name__, raw_text)
+    if key not in cache:
+        cache[key] = parser(raw_text)
+    return cache[key]
+
+
+def _project_section_kind(header: str) -> tuple[bool, bool]:
+    is_github = "GitHub" in header or "github.com" in header
+    is_docker = "DockerHub" in header or "hub.docker.com" in header or "Docker" in header
+    return is_github, is_docker
+
+
+def parse_projects(projects_text: str) -> Dict[str, List[Dict[str, str]]]:
+    """Parse projects and separate GitHub from DockerHub."""
+    github_projects = []
+    docker_projects = []
+    
+    # One walk over entry markers and section separators; each entry runs up
+    # to the next marker, and a separator switches the section kind.
+    marks = list(_PROJECT_MARK_RE.finditer(projects_text))
+    first_mark = marks[0].start() if marks else len(projects_text)
+    is_github, is_docker = _project_section_kind(projects_text[:first_mark])
+    
+    for idx, mark in enumerate(marks):
+        end = marks[idx + 1].start() if idx + 1 < len(marks) else len(projects_text)
+        entry = projects_text[mark.end():end]
+        
+        if mark.group().startswith("-"):
+            is_github, is_docker = _project_section_kind(entry)
+            continue
+        
+        title, _, body = entry.strip().partition('\n')
+        if body:
+            title = title.strip()
+            url_match = _URL_LINE_RE.search(body)
+            note_match = _NOTE_LINE_RE.search(body)
+            url = url_match.group(1).strip() if url_match else ""
+            description = note_match.group(1).strip() if note_match else ""
+            
+            repo_name = title
+            creator = "Unknown"
+            
+            github_match = _GITHUB_REPO_RE.search(url)
+            if github_match:
+                creator, repo_name = github_match.groups()
+            
+            project_data = {
+                "title": title,
+                "repo_name": repo_name,
+                "creator": creator,
+                "url": url,
+                "description": description
+            }
+            
+            if is_github or "github.com" in url:
+                github_projects.append(project_data)
+            elif is_docker or "hub.docker.com" in url:
+                docker_projects.append(project_data)
+    
+    return {
+        "github": github_projects,
+        "docker": docker_projects
+    }
+
+
+def parse_videos(videos_text: str) -> List[Dict[str, str]]:
+    if not videos_text:
+        return []
+    
+    videos = []
+    entries = _ENTRY_RE.split(videos_text)
+    
+    for entry in entries[1:]:
+        lines = entry.strip().splitlines()
+        if len(lines) < 2:
+            continue
+        
+        title, url, *_ = lines
+        title, url = title.strip(), url.strip()
+        
+        m = _YT_ID_RE.search(url)
+        video_id = m.group(1) if m else ""
+        
+        videos.append({
+            "title": title,
+            "url": url,
+            "video_id": video_id
+        })
+    
+    return videos
+
+
+@dataclass(slots=True)
+class QuizQuestion:
+    number: int
+    text: str
+    A: str
+    B: str
+    C: str
+    D: str
+    correct: str
+
+
+@dataclass(slots=True)
+class Exercise:
+    number: int
+    text: str
+
+
+def parse_quiz(quiz_text: str) -> Tuple[List[QuizQuestion], List[Exercise]]:
+    questions: List[QuizQuestion] = []
+    exercises: List[Exercise] = []
+    
+    parts = quiz_text.split("[EXERCISES]")
+    quiz_section = parts[0].replace("[QUIZ]", "").strip()
+    exercises_section = parts[1].strip() if len(parts) > 1 else ""
+    
+    for m in _QUESTION_RE.finditer(quiz_section):
+        questions.append(QuizQuestion(
+            number=int(m[1]),
+            text=m[2].strip(),
+            A=m[3].strip(),
+            B=m[4].strip(),
+            C=m[5].strip(),
+            D=m[6].strip(),
+            correct=m[7].strip(),
+        ))
+    
+    for m in _EXERCISE_RE.finditer(exercises_section):
+        exercises.append(Exercise(number=int(m[1]), text=m[2].strip()))
+    
+    return questions, exercises
+
+
+def run_pipeline(
+    subject: str,
+    chapter: str,
+    help_types: list[str],
+    guide_mode: bool,
+    uploaded_file,
+    engine_code: str,
+) -> Dict[str, Any]:
+    from agents import (
+        get_llm,
+        a1_everything,
+        a2_cleaner,
+        a3_adapter,
+        a4_summarizer,
+        a5_collector_videos,
+        a6_relations_projects,
+        a7_ai_companion_quiz,
+        a8_examiner,
+    )
+
+    llm = get_llm(engine_code)
+
+    context_text = ""
+    a1_output = ""
+    a2_output = ""
+    a3_output = ""
+
+    extras = {"videos": "", "projects": "", "quizzes": "", "exams": ""}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # A5, A6 and A8 only need subject/chapter: start them right away so
+        # they overlap with the A1 -> A2 -> A4 chain below.
+        futures = {}
+        if "Videos" in help_types:
+            futures["videos"] = executor.submit(a5_collector_videos, subject, chapter)
+        if "Related Projects" in help_types:
+            futures["projects"] = executor.submit(a6_relations_projects, subject, chapter)
+        if "Exams" in help_types:
+            futures["exams"] = executor.submit(a8_examiner, subject, chapter)
+
+        if uploaded_file is not None:
+            a3_output = a3_adapter(uploaded_file)
+            context_text = a3_output
+        else:
+            a1_output = a1_everything(subject, chapter)
+            a2_output = a2_cleaner(llm, subject, a1_output)
+            context_text = a2_output
+
+        summary = a4_summarizer(llm, context_text, guide_mode=guide_mode)
+
+        # A7 is the only extra agent that depends on the summary.
+        if "Quizzes/Exercises" in help_types:
+            futures["quizzes"] = executor.submit(a7_ai_companion_quiz, llm, summary)
+
+        for key, future in futures.items():
+            try:
+                extras[key] = future.result()
+            except Exception as exc:
+                extras[key] = _AGENT_ERROR_TMPL.format(key=key, exc=exc)
+
+    # Normalize once here so every rerun renders plain str without re-coercing.
+    results = {
+        "a1_output": a1_output,
+        "a2_output": a2_output,
+        "a3_output": a3_output,
+        "summary": summary,
+        **extras,
+    }
+    return {key: sanitize_text(value) for key, value in results.items()}
+
+
+@st.fragment
+def _render_quiz():
+    """Score bar, quiz form or graded answers, and exercises.
+
+    Runs as a fragment, so submitting or retaking the quiz reruns only this
+    block instead of every tab on the page.
+    """
+    questions, exercises = cached_parse(parse_quiz, st.session_state.quizzes)
+
+    total_questions = len(questions)
+    max_score = QUIZ_MAX_SCORE
+    points_per_question = max_score / total_questions if total_questions > 0 else 0
+
+    col_score1, col_score2 = st.columns([3, 1])
+    with col_score1:
+        st.progress(st.session_state.quiz_score / max_score if max_score > 0 else 0)
+    with col_score2:
+        st.markdown(f"### {st.session_state.quiz_score}/{max_score}")
+
+    st.markdown("---")
+
+    if not st.session_state.quiz_submitted:
+        # One radio per question inside a form: picking answers does not
+        # rerun the script, only the final submit does.
+        with st.form("quiz_form"):
+            for question in questions:
+                q_num = question.number
+
+                st.markdown(
+                    _QUIZ_QUESTION_TMPL.format(q_num=q_num, text=question.text),
+                    unsafe_allow_html=True,
+                )
+
+                st.radio(
+                    question.text or f"Q{q_num}",
+                    QUIZ_OPTION_KEYS,
+                    index=None,
+                    format_func=lambda key, question=question: f"{key}) {getattr(question, key)}",
+                    key=f"{QUIZ_CHOICE_PREFIX}{q_num}",
+                    label_visibility="collapsed",
+                )
+
+                st.markdown("<br>", unsafe_allow_html=True)
+
+            # Grading runs as a callback, ahead of the rerun the submit
+            # triggers, so no second st.rerun() is needed.
+            st.form_submit_button(
+                "Submit Answers",
+                type="primary",
+                use_container_width=True,
+                on_click=submit_quiz,
+                args=(questions, points_per_question),
+            )
+    else:
+        for question in questions:
+            q_num = question.number
+
+            st.markdown(
+                _QUIZ_QUESTION_TMPL.format(q_num=q_num, text=question.text),
+                unsafe_allow_html=True,
+            )
+
+            current_answer = st.session_state.quiz_answers.get(f"q_{q_num}")
+
+            for option_key in QUIZ_OPTION_KEYS:
+                option_text = getattr(question, option_key)
+                is_selected = current_answer == option_key
+                is_correct = option_key == question.correct
+
+                # GREEN/RED for the chosen answer
+                bg_color, border_color = _QUIZ_COLORS[(is_selected, is_correct)]
+
+                col_opt_label, col_opt_box = st.columns([0.08, 0.92])
+
+                with col_opt_label:
+                    st.markdown(f"**{option_key})**")
+
+                with col_opt_box:
+                    st.markdown(
+                        _QUIZ_OPTION_TMPL.format(
+                            bg_color=bg_color,
+                            border_color=border_color,
+                            option_text=option_text,
+                        ),
+                        unsafe_allow_html=True,
+                    )
+
+            st.markdown("<br>", unsafe_allow_html=True)
+
+        st.success(f"Score: {st.session_state.quiz_score}/{max_score}")
+        st.button("Retake Quiz", use_container_width=True, on_click=reset_quiz_state)
+
+    if exercises:
+        st.markdown("---")
+        st.markdown("### Exercises")
+        for exercise in exercises:
+            st.markdown(
+                _EXERCISE_TMPL.format(number=exercise.number, text=exercise.text),
+                unsafe_allow_html=True,
+            )
+
+
+def _render_agent_status_panel(output: Dict[str, Any]):
+    """Agent cards and pipeline flow for the debug tab."""
+    vals = {
+        card.key: st.session_state.get(card.key) if card.in_session_state else output.get(card.key)
+        for card in AGENT_CARDS
+    }
+
+    for card in AGENT_CARDS:
+        value = vals[card.key]
+        with st.expander(card.title, expanded=False):
+            st.markdown(_AGENT_CARD_MD.format(
+                fn=card.function, inp=card.input, outp=card.output, status=agent_status(card, value)
+            ))
+            st.text(_display(value, card.fallback))
+
+    st.html(_PIPELINE_FLOW_HTML)
+
+
+def show():
+    """Display the study page."""
+    init_session_state()
+
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
+
+    # Section 1
+    st.markdown(_SECTION_TMPL.format(n=1, title="Subject Information"), unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**Speciality**")
+        selected_subject = st.selectbox(
+            "Choose speciality",
+            options=_SUBJECT_KEYS,
+            index=_SUBJECT_INDEX[st.session_state.selected_subject],
+            key="subject_select",
+            label_visibility="collapsed"
+        )
+        st.session_state.selected_subject = selected_subject
+    
+    with col2:
+        st.markdown("**Subject (Matiere)**")
+        subject = st.text_input(
+            "Enter subject",
+            value=selected_subject,
+            key="subject_input",
+            label_visibility="collapsed"
+        )
+    
+    with col3:
+        st.markdown("**Chapter (Chapitre)**")
+        suggested_chapters = SUBJECTS_DB.get(selected_subject, ())
+        
+        if suggested_chapters:
+            chapter_options = ("Custom...",) + suggested_chapters
+            chapter_selection = st.selectbox(
+                "Select or enter chapter",
+                options=chapter_options,
+                key="chapter_select",
+                label_visibility="collapsed"
+            )
+            
+            if chapter_selection == "Custom...":
+                chapter = st.text_input(
+                    "Enter custom chapter",
+                    value="",
+                    key="custom_chapter",
+                    label_visibility="collapsed"
+                )
+            else:
+                chapter = chapter_selection
+        else:
+            chapter = st.text_input(
+                "Enter chapter",
+                value="",
+                key="chapter_input",
+                label_visibility="collapsed"
+            )
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Section 2
+    st.markdown(_SECTION_TMPL.format(n=2, title="Optional: Upload Your Course File"), unsafe_allow_html=True)
+    
+    uploaded_file = st.file_uploader(
+        "Drag and drop file here or click to browse",
+        type=["pdf", "docx", "txt"],
+        help="Limit 200MB per file • PDF, DOCX, TXT"
+    )
+    
+    if uploaded_file:
+        st.success(f"✅ File uploaded: {uploaded_file.name}")
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Section 3
+    st.markdown(_SECTION_TMPL.format(n=3, title="Select AI Engine and Help Options"), unsafe_allow_html=True)
+    
+    col_engine, col_options = st.columns([1, 1])
+    
+    with col_engine:
+        st.markdown("### AI Engine")
+        engine_label = st.selectbox(
+            "Choose your AI engine",
+            _ENGINE_LABELS,
+            index=_ENGINE_INDEX.get("Deepseek 3.1", 0),
+            key="engine_selector"
+        )
+        engine_info = ENGINE_OPTIONS[engine_label]
+        engine_code = engine_info["code"]
+        engine_env_var = engine_info["env_var"]
+
+        st.session_state.engine_code = engine_code
+
+        api_ok = check_api_key(engine_env_var)
+        if api_ok:
+            st.success(f"✓ {engine_label} key found")
+        else:
+            st.error(f"✗ {engine_label} key missing")
+
+    with col_options:
+        st.markdown("### Learning Resources")
+        
+        help_option_1 = st.checkbox("Summarize (Default)", value=True, key="help_summarize")
+        help_option_2 = st.checkbox("Videos", value=False, key="help_videos")
+        help_option_3 = st.checkbox("Related Projects", value=False, key="help_projects")
+        help_option_4 = st.checkbox("Quizzes/Exercises", value=True, key="help_quizzes")
+        help_option_5 = st.checkbox("Exams", value=False, key="help_exams")
+        
+        help_types = []
+        if help_option_1:
+            help_types.append("Summarize (Default)")
+        if help_option_2:
+            help_types.append("Videos")
+        if help_option_3:
+            help_types.append("Related Projects")
+        if help_option_4:
+            help_types.append("Quizzes/Exercises")
+        if help_option_5:
+            help_types.append("Exams")
+
+        guide_mode = st.checkbox("Activate guide mode", value=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    if st.button("🚀 Generate study pack", type="primary", use_container_width=True):
+        if not subject.strip() or not chapter.strip():
+            st.error("⚠️ Please fill in both subject and chapter.")
+        elif not check_api_key(engine_env_var):
+            st.error(f"⚠️ {engine_label} key is missing.")
+        else:
+            with st.spinner("Running multi-agent pipeline..."):
+                try:
+                    output = run_pipeline(
+                        subject=subject,
+                        chapter=chapter,
+                        help_types=help_types,
+                        guide_mode=guide_mode,
+                        uploaded_file=uploaded_file,
+                        engine_code=engine_code,
+                    )
+                    st.session_state.mas_output = output
+                    st.session_state.summary = output["summary"]
+                    st.session_state.videos = output["videos"]
+                    st.session_state.projects = output["projects"]
+                    st.session_state.quizzes = output["quizzes"]
+                    st.session_state.exams = output["exams"]
+                    st.session_state.roadmap = ""
+                    st.session_state._parsed_cache = {}
+                    
+                    reset_quiz_state()
+                    
+                    history_entry = {
+                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "subject": subject,
+                        "chapter": chapter,
+                        "engine": engine_label,
+                        "help_types": help_types
+                    }
+                    st.session_state.study_history.append(history_entry)
+                    
+                    st.success("✅ Study pack generated!")
+                    
+                    failed = failed_agents(output)
+                    if failed:
+                        st.warning(
+                            f"⚠️ Some agents failed: {', '.join(failed)}. "
+                            "See their tabs or the Debug tab for details."
+                        )
+                except Exception as exc:
+                    st.error(f"❌ Error: {exc}")
+
+    if st.session_state.mas_output is None:
+        st.info("💡 Fill in the fields above and click **Generate study pack**.")
+        return
+
+    st.markdown("---")
+
+    tabs = st.tabs([
+        "Summary",
+        "Videos",
+        "Projects",
+        "Quizzes",
+        "Exams",
+        "Roadmap",
+        "Debug",
+    ])
+
+    with tabs[0]:
+        st.markdown("### Summary")
+        st.markdown(render_text(st.session_state.summary))
+
+    with tabs[1]:
+        st.markdown("### Recommended Videos")
+        if is_agent_error(st.session_state.videos):
+            st.error(st.session_state.videos)
+        elif st.session_state.videos:
+            videos = cached_parse(parse_videos, st.session_state.videos)
+            
+            for idx, video in enumerate(videos):
+                with st.container():
+                    col_img, col_details = st.columns([1, 2])
+                    
+                    with col_img:
+                        if video["video_id"]:
+                            video_id = html.escape(video["video_id"])
+                            st.markdown(
+                                f'<img src="https://img.youtube.com/vi/{video_id}/mqdefault.jpg" '
+                                f'loading="lazy" style="width:100%;border-radius:8px">',
+                                unsafe_allow_html=True,
+                            )
+                    
+                    with col_details:
+                        st.markdown(f"**{video['title']}**  \n[▶️ Watch Video]({video['url']})")
+                    
+                    if idx < len(videos) - 1:
+                        st.markdown("---")
+        else:
+            st.info("No videos generated.")
+
+    with tabs[2]:
+        st.markdown("### Related Projects")
+        if is_agent_error(st.session_state.projects):
+            st.error(st.session_state.projects)
+        elif st.session_state.projects:
+            projects_dict = cached_parse(parse_projects, st.session_state.projects)
+            
+            # GitHub Projects
+            if projects_dict["github"]:
+                st.markdown("#### 🐙 GitHub Projects")
+                for project in projects_dict["github"]:
+                    with st.expander(f"**{project['repo_name']}** by {project['creator']}", expanded=False):
+                        st.markdown(
+                            f"**Description:** {project['description']}  \n"
+                            f"**Link:** [View Repository]({project['url']})"
+                        )
+                st.markdown("<br>", unsafe_allow_html=True)
+            
+            # Docker Projects
+            if projects_dict["docker"]:
+                st.markdown("#### 🐳 DockerHub Projects")
+                for project in projects_dict["docker"]:
+                    with st.expander(f"**{project['repo_name']}** by {project['creator']}", expanded=False):
+                        st.markdown(
+                            f"**Description:** {project['description']}  \n"
+                            f"**Link:** [View Repository]({project['url']})"
+                        )
+        else:
+            st.info("No projects generated.")
+
+    with tabs[3]:
+        st.markdown("### Quizzes and Exercises")
+        
+        if is_agent_error(st.session_state.quizzes):
+            st.error(st.session_state.quizzes)
+        elif st.session_state.quizzes:
+            _render_quiz()
+            
+            st.markdown("---")
+            st.markdown("### Personalize Your Roadmap")
+            
+            if st.button("Generate Roadmap", use_container_width=True):
+                with st.spinner("Generating..."):
+                    try:
+                        from agents import get_llm, a9_guide
+                        
+                        engine_code_for_roadmap = st.session_state.get("engine_code", DEFAULT_ENGINE)
+                        llm_for_roadmap = get_llm(engine_code_for_roadmap)
+                        
+                        score_ratio = st.session_state.quiz_score / QUIZ_MAX_SCORE
+                        correct_answers = round(score_ratio * 3)
+                        
+                        roadmap = a9_guide(
+                            llm=llm_for_roadmap,
+                            summary=st.session_state.summary,
+                            self_score=correct_answers,
+                            total_questions=3,
+                        )
+                        st.session_state.roadmap = sanitize_text(roadmap)
+                        if is_agent_error(st.session_state.roadmap):
+                            st.error(st.session_state.roadmap)
+                        else:
+                            st.success("✅ Roadmap generated!")
+                    except Exception as exc:
+                        st.error(f"Error: {exc}")
+        else:
+            st.info("No quizzes generated.")
+
+    with tabs[4]:
+        st.markdown("### Past Exam PDFs")
+        if is_agent_error(st.session_state.exams):
+            st.error(st.session_state.exams)
+        elif st.session_state.exams:
+            st.markdown(render_text(st.session_state.exams))
+        else:
+            st.info("No exams generated.")
+
+    with tabs[5]:
+        st.markdown("### Study Roadmap")
+        if st.session_state.roadmap:
+            st.markdown(render_text(st.session_state.roadmap))
+        else:
+            st.info("Generate roadmap from Quizzes tab.")
+
+    with tabs[6]:
+        st.markdown("### Debug Information - AI Agents Workflow")
+        output = st.session_state.mas_output
+
+        st.markdown(_PIPELINE_SUMMARY_HTML, unsafe_allow_html=True)
+
+        _render_agent_status_panel(output)